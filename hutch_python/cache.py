@@ -14,12 +14,18 @@ from .utils import HelpfulNamespace
 
 logger = logging.getLogger(__name__)
 
+# Marks parent module attributes that did not exist before publishing
+_missing = object()
+
 
 class LoadCache:
     """
     Class that accumulates objects in a virtual module.
 
     This virtual module can be imported from as if it were a normal module.
+    It is registered in ``sys.modules`` on creation if initial objects are
+    given, otherwise the first time objects are added or when `publish` is
+    called.
 
     Parameters
     ----------
@@ -44,8 +50,57 @@ class LoadCache:
         self.objs = HelpfulNamespace(**objs)
         self.hutch_dir = hutch_dir
         self.module = module
-        self.spoof_module(module)
-        self.spoof_module('hutch_python.db')
+        self._registered = False
+        self._prev_modules = {}
+        self._prev_attrs = {}
+        if objs:
+            self.publish()
+
+    def publish(self):
+        """
+        Make the namespace importable as ``module`` and ``hutch_python.db``.
+
+        Any modules these names pointed to before, both in ``sys.modules`` and
+        as attributes of their parent modules, are kept so that `unregister`
+        can put them back.
+        """
+        if self._registered:
+            return
+        for module_name in (self.module, 'hutch_python.db'):
+            self._prev_modules[module_name] = sys.modules.get(module_name)
+            self.spoof_module(module_name)
+        self._registered = True
+
+    def unregister(self):
+        """
+        Undo `publish`, restoring whatever was there before.
+
+        Names that have since been claimed by another ``LoadCache`` are left
+        as they are.
+        """
+        if not self._registered:
+            return
+        # Leave alone any names a newer cache has since taken over
+        for module_name, prev in self._prev_modules.items():
+            if sys.modules.get(module_name) is not self.objs:
+                continue
+            if prev is None:
+                del sys.modules[module_name]
+            else:
+                sys.modules[module_name] = prev
+        for (parent_module, attr), prev in self._prev_attrs.items():
+            if getattr(parent_module, attr, None) is not self.objs:
+                continue
+            if prev is _missing:
+                try:
+                    delattr(parent_module, attr)
+                except AttributeError:
+                    pass
+            else:
+                setattr(parent_module, attr, prev)
+        self._prev_modules = {}
+        self._prev_attrs = {}
+        self._registered = False
 
     def spoof_module(self, module_name):
         """
@@ -57,7 +112,11 @@ class LoadCache:
         if parent:
             try:
                 parent_module = import_module(parent)
-                setattr(parent_module, module_parts[-1], self.objs)
+                attr = module_parts[-1]
+                self._prev_attrs.setdefault(
+                    (parent_module, attr),
+                    getattr(parent_module, attr, _missing))
+                setattr(parent_module, attr, self.objs)
             except ImportError:
                 logger.debug('Skip patching parent module %s, does not import',
                              parent, exc_info=True)
@@ -65,17 +124,25 @@ class LoadCache:
         # Place it here so it looks like we've already imported it
         sys.modules[module_name] = self.objs
 
-    def __call__(self, **objs):
+    def __call__(self, *mappings, **objs):
         """
         Add objects to the namespace.
 
         Parameters
         ----------
+        *mappings: ``dict``
+            Mappings of namespace-accessible name to object. Pass large
+            collections this way to avoid copying them into kwargs.
+
         **objs: kwargs
             The key will is the namespace-accessible name, and the object
             is the object we are adding.
         """
-        self.objs.__dict__.update(**objs)
+        for mapping in mappings:
+            self.objs.__dict__.update(mapping)
+        if objs:
+            self.objs.__dict__.update(objs)
+        self.publish()
 
     def write_file(self):
         """
@@ -85,16 +152,15 @@ class LoadCache:
         if self.hutch_dir is not None:
             parts = self.module.split('.')
             parts[-1] = parts[-1] + '.txt'
-            db_path = self.hutch_dir / Path('/'.join(parts))
-            text = (header.format(parts[0])
-                    + body.format(datetime.datetime.now()))
+            db_path = Path(self.hutch_dir).joinpath(*parts)
+            lines = [header.format(parts[0]),
+                     body.format(datetime.datetime.now())]
             for name, obj in self.objs.__dict__.items():
-                text += f'{name:<20} {obj.__class__}\n'
+                lines.append(f'{name:<20} {obj.__class__}\n')
             if not db_path.exists():
                 db_path.touch()
                 db_path.chmod(0o666)
-            with db_path.open('w') as f:
-                f.write(text)
+            db_path.write_text(''.join(lines), encoding='utf-8')
 
     def doc(self, **docs):
         """
@@ -11,6 +11,10 @@ CLASS_SEARCH_PATH = ['pcdsdevices.device_types']
 
 EPICS_ARCH_FILE_PATH = '/cds/group/pcds/dist/pds/{}/misc/'
 
+QS_CACHE_DIR = '~/.cache/hutch_python/qs'
+
+QS_CACHE_TTL = 300
+
 DIR_MODULE = Path(__file__).resolve().parent
 
 FILE_YAML = DIR_MODULE / 'logging.yml'
@@ -13,4 +13,4 @@ debug_tools = {
 
 
 def load_debug(cache):
-    cache(**debug_tools)
+    cache(debug_tools)
@@ -1,16 +1,19 @@
 """Module to help create the epicsArch file that will be read by the DAQ."""
 import argparse
+import json
 import logging
 import os
-import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from pathlib import Path
+from typing import NamedTuple
 
 from prettytable import PrettyTable
 
-from .constants import EPICS_ARCH_FILE_PATH
+from .constants import EPICS_ARCH_FILE_PATH, QS_CACHE_DIR, QS_CACHE_TTL
 from .qs_load import get_qs_client
+from .utils import write_json_atomic
 
 try:
     import psdm_qs_cli
@@ -20,9 +23,8 @@ except ImportError:
     QuestionnaireClient = None
 
 
-# Annotation with dataclass, making struct to help organize cds objects in prettytable
-@dataclass
-class QStruct:
+# Lightweight struct to help organize cds objects in prettytable
+class QStruct(NamedTuple):
     alias: str
     pvbase: str
     pvtype: str
@@ -30,6 +32,19 @@ class QStruct:
 
 logger = logging.getLogger(__name__)
 
+# Map the cds item type from the questionnaire key, e.g. the ``motors`` in
+# ``pcdssetup-motors-setup-1-name``, to the field holding its pv and a label
+_CDS_TYPES = {
+    'motors': ('pvbase', 'motors'),
+    'areadet': ('pvbase', 'areadet'),
+    'ao': ('pvbase', 'analog output'),
+    'devs': ('pvbase', 'other devices'),
+    'ps': ('pvname', 'power supplies'),
+    'trig': ('pvbase', 'triggers'),
+    'vacuum': ('pvbase', 'vacuum'),
+    'temp': ('pvbase', 'temperature'),
+}
+
 
 def _create_parser():
     """Argument Parser Setup. Define shell commands."""
@@ -173,19 +188,13 @@ def pull_cds_data(exp, run):
     -------
         PrettyTable visualization of cds objects
     """
-    # pull run data from questionnaire api, then take the data and sort it
-    # create PrettyTable instance and if the values from the run data contain
-    # pcdssetup then put them into a seperate dictionary as they are cds items
+    # pull run data from questionnaire api
+    # create PrettyTable instance and pick out the pcdssetup entries from the
+    # run data as they are cds items
     logger.debug('pull_cds_items(%s)', exp)
-    client = QuestionnaireClient()
     logger.debug("in cds items, run numb:", str(run[1]))
-    runDetails_Dict = client.getProposalDetailsForRun(str(run[0]), str(run[1]))
-    sorted_runDetails_Dict = dict(sorted(runDetails_Dict.items()))
-    cds_dict = {}
+    runDetails_Dict = get_run_details(str(run[0]), str(run[1]))
     myTable = PrettyTable(["Alias", "PV Base", "Type"])
-    for keys, vals in sorted_runDetails_Dict.items():
-        if "pcdssetup" in keys:
-            cds_dict[keys] = vals
 
     # names are as follows:
     # pcdssetup-motors, pcdssetup-areadet, pcdssetup-ao, pcdssetup-devs
@@ -194,37 +203,79 @@ def pull_cds_data(exp, run):
     # iterate through all cds items and label them based on their type
     # use the struct members to identify
     displayList = []
-    for k, v in cds_dict.items():
-        if re.match('pcdssetup-motors.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "motors"))
-        elif re.match('pcdssetup-areadet.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "areadet"))
-        elif re.match('pcdssetup-ao.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "analog output"))
-        elif re.match('pcdssetup-devs.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "other devices"))
-        elif re.match('pcdssetup-ps.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvname', k), '')
-            displayList.append(QStruct(v, pv, "power supplies"))
-        elif re.match('pcdssetup-trig.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "triggers"))
-        elif re.match('pcdssetup-vacuum.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "vacuum"))
-        elif re.match('pcdssetup-temp.*-name', k):
-            pv = cds_dict.get(re.sub('name', 'pvbase', k), '')
-            displayList.append(QStruct(v, pv, "temperature"))
-
-    for struct in displayList:
-        myTable.add_row([struct.alias, struct.pvbase, struct.pvtype])
+    for k, v in runDetails_Dict.items():
+        if not (k.startswith('pcdssetup-') and k.endswith('-name')):
+            continue
+        category = k[len('pcdssetup-'):].split('-', 1)[0]
+        try:
+            pv_field, label = _CDS_TYPES[category]
+        except KeyError:
+            continue
+        # swap the trailing name for the field holding the pv
+        pv = runDetails_Dict.get(k[:-len('name')] + pv_field, '')
+        displayList.append(QStruct(v, pv, label))
+
+    # only the matched cds items need to be sorted for display
+    displayList.sort(key=lambda struct: struct.alias)
+    myTable.add_rows(displayList)
     print(myTable)
 
 
+def get_run_details(run, proposal):
+    """
+    Get the questionnaire details for a run, caching them on disk.
+
+    The response is saved in ``~/.cache/hutch_python/qs`` and reused while it
+    is younger than ``HUTCH_PYTHON_QS_TTL`` seconds, 300 by default.
+
+    Parameters
+    ----------
+    run: ``str``
+        The run number e.g. run21
+    proposal: ``str``
+        The proposal id e.g. X10032
+
+    Returns
+    -------
+    details: ``dict``
+        The questionnaire entries for this run.
+    """
+    try:
+        cache_path = (Path(QS_CACHE_DIR).expanduser()
+                      / f'{run}_{proposal}.json')
+    except RuntimeError:
+        logger.debug('No home directory, skipping the questionnaire cache',
+                     exc_info=True)
+        cache_path = None
+
+    if cache_path is not None:
+        ttl = os.getenv('HUTCH_PYTHON_QS_TTL', QS_CACHE_TTL)
+        try:
+            ttl = float(ttl)
+        except ValueError:
+            logger.warning('Invalid HUTCH_PYTHON_QS_TTL %r, using %s seconds',
+                           ttl, QS_CACHE_TTL)
+            ttl = QS_CACHE_TTL
+        try:
+            if time.time() - cache_path.stat().st_mtime < ttl:
+                with cache_path.open() as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            logger.debug('No usable questionnaire cache at %s', cache_path,
+                         exc_info=True)
+
+    client = QuestionnaireClient()
+    details = client.getProposalDetailsForRun(run, proposal)
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(cache_path, details)
+        except (OSError, TypeError, ValueError):
+            logger.debug('Could not write questionnaire cache %s',
+                         cache_path, exc_info=True)
+    return details
+
+
 def create_softlink(experiment, link_path):
     """
     This removes the softlink in the /cds/group/pcds/dist/pds/{}/misc/ and
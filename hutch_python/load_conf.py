@@ -2,7 +2,9 @@
 This module is responsible for reading and interpreting the ``conf.yml`` file.
 The file's specification can be found on the `yaml_files` page.
 """
+import json
 import logging
+import os
 from copy import copy
 from pathlib import Path
 from socket import gethostname
@@ -39,13 +41,19 @@ from .plan_wrappers import initialize_wrapper_namespaces, register_plan
 from .user_load import get_user_objs
 from .utils import (get_current_experiment, hutch_banner, safe_load,
                     HelpfulNamespace, AbortSigintHandler,
-                    SigquitHandler, abort_msg)
+                    SigquitHandler, abort_msg, write_json_atomic)
 
 try:
     from elog import HutchELog
 except ImportError:
     HutchELog = None
 
+try:
+    # Use the libyaml bindings when available, they are much faster
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +64,7 @@ def load(cfg=None, args=None):
     This method:
 
     - Finds the hutch's launch directory
+    - Reads the ``conf.yml`` file, reusing the cached copy if it is current
     - Modify the conf if specified by args
       - ``exp`` is an override for the experiment key
     - Loads the hutch's objects by calling `load_conf.load_conf`
@@ -79,8 +88,7 @@ def load(cfg=None, args=None):
         conf = {}
         hutch_dir = None
     else:
-        with open(cfg) as f:
-            conf = yaml.safe_load(f)
+        conf = read_conf(cfg)
         conf_path = Path(cfg)
         hutch_dir = conf_path.parent
 
@@ -91,6 +99,63 @@ def load(cfg=None, args=None):
     return load_conf(conf, hutch_dir=hutch_dir, args=args)
 
 
+def read_conf(cfg):
+    """
+    Parse the ``conf.yml`` file, using a ``json`` cache when possible.
+
+    After the yaml is parsed, the result is saved next to it as
+    ``conf.yml.cache.json``, unless it would not survive the trip through
+    ``json`` unchanged. The cache records the yaml file's modification time
+    and size, and on the next startup it is read instead of the yaml file
+    only if both still match exactly.
+    Failing to write the cache, e.g. on a read-only filesystem, is not an
+    error. Set ``HUTCH_PYTHON_CONF_CACHE=0`` to always read the yaml file
+    and never write the cache.
+
+    Parameters
+    ----------
+    cfg: ``str``
+        Path to the ``conf.yml`` file.
+
+    Returns
+    -------
+    conf: ``dict``
+        ``dict`` interpretation of the yaml file
+    """
+    if os.getenv('HUTCH_PYTHON_CONF_CACHE') == '0':
+        with open(cfg) as f:
+            return yaml.load(f, Loader=_Loader)
+
+    cache_path = str(cfg) + '.cache.json'
+    yaml_stat = os.stat(cfg)
+    stamp = {'mtime_ns': yaml_stat.st_mtime_ns, 'size': yaml_stat.st_size}
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached['stamp'] == stamp:
+            return cached['conf']
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.debug('Could not use conf cache %s', cache_path,
+                     exc_info=True)
+
+    with open(cfg) as f:
+        conf = yaml.load(f, Loader=_Loader)
+    try:
+        text = json.dumps(conf)
+        # json turns non-str keys into str, only cache what comes back as-is
+        if json.loads(text) != conf:
+            raise ValueError(f'{cfg} does not round-trip through json')
+        write_json_atomic(cache_path, {'stamp': stamp, 'conf': conf})
+    except (OSError, TypeError, ValueError):
+        logger.debug('Could not write conf cache %s', cache_path,
+                     exc_info=True)
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    return conf
+
+
 def load_conf(conf, hutch_dir=None, args=None):
     """
     Step through the object loading procedure, given a configuration.
@@ -440,7 +505,7 @@ def load_conf(conf, hutch_dir=None, args=None):
 
     # Shared global devices for LCLS
     with safe_load('lcls PVs'):
-        cache(**global_devices())
+        cache(global_devices())
         cache.doc(**global_device_docs)
 
     # Happi db and Lightpath
@@ -450,16 +515,16 @@ def load_conf(conf, hutch_dir=None, args=None):
 
             # Gather relevant objects given the BeamPath
             happi_objs = get_happi_objs(db, lc, hutch, load_level=load_level)
-            cache(**happi_objs)
+            cache(happi_objs)
 
             # create and store beampath
             if lc is not None:
                 bp = lc.active_path(hutch.upper())
                 beampath_name = f"{hutch.lower()}_beampath"
-                cache(**{beampath_name: bp})
+                cache({beampath_name: bp})
                 cache.doc(**{beampath_name: 'Lightpath beam path object.'})
 
-                cache(**{'light_ctrl': lc})
+                cache(light_ctrl=lc)
                 cache.doc(light_ctrl='Lightpath LightController object')
 
     # ArchApp
@@ -503,12 +568,12 @@ def load_conf(conf, hutch_dir=None, args=None):
     # Load questionnaire
     if experiment is not None:
         qs_objs = get_qs_objs(full_expname)
-        cache(**qs_objs)
+        cache(qs_objs)
 
     # Load user/beamline files
     if load is not None:
         load_objs = get_user_objs(load)
-        cache(**load_objs)
+        cache(load_objs)
 
     # Load experiment file
     if experiment is not None:
@@ -595,4 +660,4 @@ def default_class_namespace(cls, name, cache):
     """
     objs = class_namespace(cls, scope='hutch_python.db')
     if len(objs) > 0:
-        cache(**{name: objs, name[0]: objs})
+        cache({name: objs, name[0]: objs})
@@ -2,19 +2,14 @@ import logging
 import os.path
 from configparser import ConfigParser, NoOptionError
 
-import happi
-from happi.loader import load_devices
-
 from .utils import safe_load
 
-try:
-    from happi.backends.qs_db import QSBackend
-except ImportError:
-    # Optional because not available on windows
-    QSBackend = None
-
 logger = logging.getLogger(__name__)
 
+# Authentication files for the questionnaire, in order of priority
+_QS_CFG_PATHS = ('qs.cfg', '.qs.cfg', os.path.expanduser('~/.qs.cfg'),
+                 'web.cfg', '.web.cfg', os.path.expanduser('~/.web.cfg'))
+
 
 def get_qs_objs(expname):
     """
@@ -31,8 +26,12 @@ def get_qs_objs(expname):
         Mapping from questionnaire ``python name`` to loaded object.
     """
     logger.debug('get_qs_client(%s)', expname)
-    with safe_load('questionnaire'):
+    if not expname:
+        return {}
+    if not expname.islower():
         expname = expname.lower()
+    with safe_load('questionnaire'):
+        from happi.loader import load_devices
         qs_client = get_qs_client(expname)
         # Create namespace
         if not qs_client.all_items:
@@ -54,11 +53,12 @@ def get_qs_client(expname):
     There are two possible methods of authentication to the
     ``QuestionnaireClient``, ``Kerberos`` and ``WS-Auth``. The first is simpler
     but is not possible for all users, we therefore search for a configuration
-    file named ``web.cfg``, either hidden in the current directory or the users
-    home directory. This should contain the username and password needed to
-    authenticate into the ``QuestionnaireClient``. The format of this
-    configuration file is the standard ``.ini`` structure and should define the
-    username and password like:
+    file named ``qs.cfg`` or ``web.cfg``, either hidden in the current directory
+    or the users home directory. Only the first readable file found is used.
+    This should contain the username and password needed to authenticate into
+    the ``QuestionnaireClient``. The format of this configuration file is the
+    standard ``.ini`` structure and should define the username and password
+    like:
 
     .. code:: ini
 
@@ -76,17 +76,24 @@ def get_qs_client(expname):
     qs_client: `happi.Client`
         Mapping from questionnaire ``python name`` to loaded object.
     """
-    if QSBackend is None:
-        raise RuntimeError('psdm_qs_cli library unavailable')
+    # Imported here to keep happi and psdm_qs_cli out of module import time
+    import happi
+    try:
+        from happi.backends.qs_db import QSBackend
+    except ImportError as exc:
+        # Optional because not available on windows
+        raise RuntimeError('psdm_qs_cli library unavailable') from exc
     # Determine which method of authentication we are going to use.
     # Search for a configuration file, either in the current directory
     # or hidden in the users home directory. If not found, attempt to
     # launch the client via Kerberos
     cfg = ConfigParser()
-    cfgs = cfg.read(['qs.cfg', '.qs.cfg',
-                     os.path.expanduser('~/.qs.cfg'),
-                     'web.cfg', '.web.cfg',
-                     os.path.expanduser('~/.web.cfg')])
+    for path in _QS_CFG_PATHS:
+        if cfg.read(path):
+            cfgs = [path]
+            break
+    else:
+        cfgs = []
     # Ws-auth
     if cfgs:
         user = cfg.get('DEFAULT', 'user', fallback=None)
@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+import types
 from collections import namedtuple
 from contextlib import contextmanager
 from copy import copy
@@ -20,7 +21,6 @@ from ophyd.sim import FakeEpicsSignal, fake_device_cache, make_fake_device
 from pcdsdevices.areadetector.detectors import PCDSAreaDetector
 
 import hutch_python.cam_load as cam_load
-import hutch_python.qs_load
 import hutch_python.utils
 
 try:
@@ -173,7 +173,10 @@ class QSBackend:
 
 @pytest.fixture(scope='function')
 def fake_qsbackend(monkeypatch):
-    monkeypatch.setattr(hutch_python.qs_load, "QSBackend", QSBackend)
+    # qs_load imports the backend lazily, so stand in for its module
+    qs_db = types.ModuleType('happi.backends.qs_db')
+    qs_db.QSBackend = QSBackend
+    monkeypatch.setitem(sys.modules, 'happi.backends.qs_db', qs_db)
     QSBackend.empty = False
     return QSBackend
 
@@ -300,6 +303,14 @@ def cleanup_ophydobj():
     this_test_ophydobj.clear()
 
 
+@pytest.fixture(scope='function', autouse=True)
+def no_conf_cache(monkeypatch):
+    """
+    Keep load_conf from writing conf.yml caches into the source tree.
+    """
+    monkeypatch.setenv('HUTCH_PYTHON_CONF_CACHE', '0')
+
+
 @pytest.fixture(autouse=True)
 def patch_areadet():
     fake_device_cache[EpicsSignalWithRBV] = FakeEpicsSignal
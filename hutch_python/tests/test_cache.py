@@ -1,5 +1,7 @@
 import logging
+import sys
 
+import hutch_python
 from hutch_python.cache import LoadCache
 from hutch_python.load_conf import default_class_namespace
 from hutch_python.utils import extract_objs
@@ -21,6 +23,16 @@ def test_load_cache_integration():
     assert cache.objs.nums.obj3 == 3
 
 
+def test_load_cache_mappings():
+    logger.debug('test_load_cache_mappings')
+    cache = LoadCache('fake5.db')
+    cache({'obj1': 1, 'obj2': 2}, {'obj3': 3}, obj4=4)
+    assert cache.objs.obj1 == 1
+    assert cache.objs.obj2 == 2
+    assert cache.objs.obj3 == 3
+    assert cache.objs.obj4 == 4
+
+
 def test_load_cache_importable():
     logger.debug('test_load_cache_importable')
     cache = LoadCache('fake2.db')
@@ -28,3 +40,56 @@ def test_load_cache_importable():
 
     import hutch_python.db
     assert hutch_python.db.one == 1
+
+
+def test_load_cache_write_file(tmp_path):
+    logger.debug('test_load_cache_write_file')
+    (tmp_path / 'fake3').mkdir()
+    cache = LoadCache('fake3.db', hutch_dir=tmp_path)
+    cache({'one': 1, 'two': 'two'})
+    cache.write_file()
+    text = (tmp_path / 'fake3' / 'db.txt').read_text()
+    assert 'from fake3.db' in text
+    assert f"{'one':<20} {int}\n" in text
+    assert f"{'two':<20} {str}\n" in text
+    # hutch_dir may also be given as a str
+    cache = LoadCache('fake3.db', hutch_dir=str(tmp_path))
+    cache(three=3)
+    cache.write_file()
+    text = (tmp_path / 'fake3' / 'db.txt').read_text()
+    assert f"{'three':<20} {int}\n" in text
+
+
+def test_load_cache_initial_objs():
+    logger.debug('test_load_cache_initial_objs')
+    cache = LoadCache('fake8.db', z=3)
+    assert sys.modules['fake8.db'] is cache.objs
+    assert sys.modules['fake8.db'].z == 3
+    cache.unregister()
+
+
+def test_load_cache_publish():
+    logger.debug('test_load_cache_publish')
+    prev_db = sys.modules.get('hutch_python.db')
+    prev_attr = getattr(hutch_python, 'db', None)
+    cache = LoadCache('fake4.db')
+    assert 'fake4.db' not in sys.modules
+    cache(one=1)
+    assert sys.modules['fake4.db'] is cache.objs
+    assert sys.modules['hutch_python.db'] is cache.objs
+    assert hutch_python.db is cache.objs
+    cache.unregister()
+    assert 'fake4.db' not in sys.modules
+    assert sys.modules.get('hutch_python.db') is prev_db
+    assert getattr(hutch_python, 'db', None) is prev_attr
+    # Unregistering out of order keeps the newer registration
+    older = LoadCache('fake6.db')
+    older(x=1)
+    newer = LoadCache('fake7.db')
+    newer(y=2)
+    older.unregister()
+    assert 'fake6.db' not in sys.modules
+    assert sys.modules['fake7.db'] is newer.objs
+    assert sys.modules['hutch_python.db'] is newer.objs
+    assert hutch_python.db is newer.objs
+    newer.unregister()
@@ -1,13 +1,14 @@
 import json
 import logging
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import happi
 import pytest
 from conftest import cli_args
 
-from ..epics_arch import get_items, main, print_dry_run, update_file
+from ..epics_arch import (get_items, get_run_details, main, print_dry_run,
+                          pull_cds_data, update_file)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,64 @@ def test_update_file(items):
         os.remove(expected_file)
 
 
+@pytest.fixture(scope='function')
+def qs_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr('hutch_python.epics_arch.QS_CACHE_DIR',
+                        tmp_path / 'qs')
+    return tmp_path / 'qs'
+
+
+def test_pull_cds_data(qs_cache, capsys):
+    client = MagicMock()
+    client.getProposalDetailsForRun.return_value = cds_details
+    with patch('hutch_python.epics_arch.QuestionnaireClient',
+               return_value=client):
+        pull_cds_data('xppx1003221', ['run_21', 'X10032'])
+    client.getProposalDetailsForRun.assert_called_once_with('run_21',
+                                                            'X10032')
+    rows = [line.split('|')[1:-1] for line in
+            capsys.readouterr().out.splitlines() if 'XPP' in line]
+    rows = [[col.strip() for col in row] for row in rows]
+    assert rows == [
+        ['acromag', 'XPP:USR:ao1', 'analog output'],
+        ['lv', 'XPP:USR:PS:01', 'power supplies'],
+        ['tape_x', 'XPP:LBL:MMN:04', 'motors'],
+    ]
+
+
+def test_get_run_details_cache(qs_cache, monkeypatch):
+    client = MagicMock()
+    client.getProposalDetailsForRun.return_value = cds_details
+    with patch('hutch_python.epics_arch.QuestionnaireClient',
+               return_value=client):
+        assert get_run_details('run_21', 'X10032') == cds_details
+        assert sorted(qs_cache.iterdir()) == [qs_cache / 'run_21_X10032.json']
+        # A fresh cache skips the questionnaire
+        assert get_run_details('run_21', 'X10032') == cds_details
+        assert client.getProposalDetailsForRun.call_count == 1
+        # An expired cache asks again
+        monkeypatch.setenv('HUTCH_PYTHON_QS_TTL', '0')
+        assert get_run_details('run_21', 'X10032') == cds_details
+        assert client.getProposalDetailsForRun.call_count == 2
+        # A malformed ttl falls back to the default
+        monkeypatch.setenv('HUTCH_PYTHON_QS_TTL', 'soon')
+        assert get_run_details('run_21', 'X10032') == cds_details
+        assert client.getProposalDetailsForRun.call_count == 2
+
+
+def test_get_run_details_no_home(monkeypatch):
+    # An unresolvable home directory skips the cache instead of failing
+    monkeypatch.setattr('hutch_python.epics_arch.QS_CACHE_DIR',
+                        '~hutch_python_no_such_user/qs')
+    client = MagicMock()
+    client.getProposalDetailsForRun.return_value = cds_details
+    with patch('hutch_python.epics_arch.QuestionnaireClient',
+               return_value=client):
+        assert get_run_details('run_21', 'X10032') == cds_details
+        assert get_run_details('run_21', 'X10032') == cds_details
+    assert client.getProposalDetailsForRun.call_count == 2
+
+
 def test_update_file_bad_path(items):
     with patch('hutch_python.epics_arch.get_items', return_value=items):
         with pytest.raises(OSError):
@@ -108,6 +167,18 @@ def items(json_db):
     return client.all_items
 
 
+cds_details = {
+    'pcdssetup-motors-setup-1-name': 'tape_x',
+    'pcdssetup-motors-setup-1-pvbase': 'XPP:LBL:MMN:04',
+    'pcdssetup-ao-setup-1-name': 'acromag',
+    'pcdssetup-ao-setup-1-pvbase': 'XPP:USR:ao1',
+    'pcdssetup-ps-setup-1-name': 'lv',
+    'pcdssetup-ps-setup-1-pvname': 'XPP:USR:PS:01',
+    'pcdssetup-unknown-setup-1-name': 'ignored',
+    'pcdssetup-motors-setup-1-purpose': 'Tape X',
+}
+
+
 all_items = json.loads("""{
             "tape_x": {
                 "_id": "tape_x",
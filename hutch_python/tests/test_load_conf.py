@@ -1,3 +1,4 @@
+import json
 import logging
 import os.path
 from socket import gethostname
@@ -9,10 +10,10 @@ from pcdsdaq.sim import set_sim_mode
 from pcdsdaq.sim.pydaq import Control as SimControl
 from pcdsdevices.interface import Presets
 
-import hutch_python.qs_load
-from hutch_python.load_conf import load, load_conf
+import hutch_python.load_conf
+from hutch_python.load_conf import load, load_conf, read_conf
 
-from .conftest import (TST_CAM_CFG, BlueskyScan, ELog, QSBackend, lightpath,
+from .conftest import (TST_CAM_CFG, BlueskyScan, ELog, lightpath,
                        requires_elog, requires_psdaq, skip_if_win32_generic,
                        skip_if_win32_pcdsdaq)
 
@@ -46,6 +47,42 @@ def test_exp_override():
     assert hasattr(objs['x'], 'cats')
 
 
+def test_read_conf_cache(tmp_path, monkeypatch):
+    logger.debug('test_read_conf_cache')
+    monkeypatch.delenv('HUTCH_PYTHON_CONF_CACHE')
+    cfg = tmp_path / 'conf.yml'
+    cfg.write_text('hutch: tst\n')
+    cache = tmp_path / 'conf.yml.cache.json'
+    assert read_conf(str(cfg)) == {'hutch': 'tst'}
+    assert cache.exists()
+    # No temporary files are left behind
+    assert sorted(tmp_path.iterdir()) == [cfg, cache]
+    # A current cache is used instead of the yaml file
+    cached = json.loads(cache.read_text())
+    cached['conf'] = {'hutch': 'cached'}
+    cache.write_text(json.dumps(cached))
+    assert read_conf(str(cfg)) == {'hutch': 'cached'}
+    # Any change to the yaml's mtime, even to an older one, invalidates it
+    stat = cfg.stat()
+    os.utime(cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    assert read_conf(str(cfg)) == {'hutch': 'tst'}
+    # So does a change in size within the same mtime
+    cache.write_text(json.dumps(cached))
+    cfg.write_text('hutch: tst2\n')
+    mtime_ns = cached['stamp']['mtime_ns']
+    os.utime(cfg, ns=(mtime_ns, mtime_ns))
+    assert read_conf(str(cfg)) == {'hutch': 'tst2'}
+    # Confs that json would change are not cached
+    cfg.write_text('hutch: tst\n1: one\n')
+    assert read_conf(str(cfg)) == {'hutch': 'tst', 1: 'one'}
+    assert not cache.exists()
+    # The cache can be turned off
+    cfg.write_text('hutch: tst\n')
+    monkeypatch.setenv('HUTCH_PYTHON_CONF_CACHE', '0')
+    assert read_conf(str(cfg)) == {'hutch': 'tst'}
+    assert not cache.exists()
+
+
 def test_no_file():
     logger.debug('test_no_file')
     objs = load()
@@ -131,9 +168,8 @@ def test_skip_failures():
 
 
 @skip_if_win32_generic
-def test_auto_experiment(fake_curexp_script):
+def test_auto_experiment(fake_curexp_script, fake_qsbackend):
     logger.debug('test_auto_experiment')
-    hutch_python.qs_load.QSBackend = QSBackend
     objs = load_conf(dict(hutch='tst'))
     assert objs['inj_x'].run == '15'
     assert objs['inj_x'].proposal == 'LR12'
@@ -4,6 +4,8 @@ import happi
 
 from hutch_python.qs_load import get_qs_objs
 
+from .conftest import cfg
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +24,8 @@ def test_qs_load(fake_qsbackend):
     fake_qsbackend.empty = True
     assert get_qs_objs('tstlr1215') == dict()
     fake_qsbackend.empty = False
+    # No experiment means nothing to load
+    assert get_qs_objs('') == dict()
 
 
 def test_ws_auth_conf(temporary_config, fake_qsbackend):
@@ -31,3 +35,15 @@ def test_ws_auth_conf(temporary_config, fake_qsbackend):
     assert objs['inj_x'].kerberos == 'False'
     assert objs['inj_x'].user == 'user'
     assert objs['inj_x'].pw == 'pw'
+
+
+def test_ws_auth_conf_fallthrough(tmp_path, monkeypatch, fake_qsbackend):
+    logger.debug('test_ws_auth_conf_fallthrough')
+    clear_happi_cache()
+    monkeypatch.chdir(tmp_path)
+    # An unreadable qs.cfg should not stop the search for web.cfg
+    (tmp_path / 'qs.cfg').mkdir()
+    (tmp_path / 'web.cfg').write_text(cfg)
+    objs = get_qs_objs('tstlr1215')
+    assert objs['inj_x'].kerberos == 'False'
+    assert objs['inj_x'].user == 'user'
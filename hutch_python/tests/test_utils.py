@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 import os
 import threading
@@ -125,6 +126,18 @@ def test_strip_prefix():
     assert utils.strip_prefix('cats', 'dogs') == 'cats'
 
 
+def test_write_json_atomic(tmp_path):
+    logger.debug('test_write_json_atomic')
+    path = tmp_path / 'data.json'
+    utils.write_json_atomic(path, {'one': 1})
+    assert json.loads(path.read_text()) == {'one': 1}
+    # A failed write keeps the old file and cleans up after itself
+    with pytest.raises(TypeError):
+        utils.write_json_atomic(path, {'bad': object()})
+    assert json.loads(path.read_text()) == {'one': 1}
+    assert sorted(tmp_path.iterdir()) == [path]
+
+
 def test_hutch_banner():
     logger.debug('test_hutch_banner')
     utils.hutch_banner()
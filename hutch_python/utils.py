@@ -5,6 +5,7 @@ module.
 """
 import functools
 import inspect
+import json
 import logging
 import os
 import signal
@@ -377,6 +378,40 @@ def strip_prefix(name, strip_text):
         return name
 
 
+def write_json_atomic(path, data):
+    """
+    Write ``data`` to ``path`` as ``json`` without exposing a partial file.
+
+    The data goes to a temporary file next to ``path`` that is then moved into
+    place, so readers see either the old file or the new one. The temporary
+    file is removed if anything fails.
+
+    Parameters
+    ----------
+    path: ``str`` or ``Path``
+        The file to write.
+
+    data: ``object``
+        Anything ``json`` can serialize.
+
+    Raises
+    ------
+    OSError, TypeError, ValueError
+        If the file cannot be written or ``data`` cannot be serialized.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def maybe_exit(logger, message, exception_message, *, exit_code=1):
     """
     For potentially fatal exceptions, prompt the user whether or not to exit.